@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+import time
+
+# Cold-start budget (seconds) for a headless batch worker: import the
+# construction module, build a small graph and export it, without plotting.
+BUDGET = 0.8
+RUNS = 5
+# The only non-stdlib modules a worker may load. The construction core is built on
+# networkx and python-sat (pyformula is its extension), so those are still loaded.
+ALLOWED = ("networkx", "pysat", "pyformula", "numpy")
+
+WORKER = """
+import sys
+baseline = set(sys.modules)
+from construction import SATGraph
+
+G = SATGraph()
+G.generate_random_cnf(num_clauses=4, num_variables=3)
+G.clause_to_clique()
+G.literal_to_node()
+G.x_to_not_x()
+G.to_d3_json()
+
+heavy = [m for m in ("matplotlib", "pyvis", "PyQt5", "scipy", "pandas") if m in sys.modules]
+if heavy:
+    sys.exit("heavy modules loaded at startup: " + ", ".join(heavy))
+
+third_party = sorted({
+    name.split(".")[0] for name in set(sys.modules) - baseline
+    if name.split(".")[0] not in sys.stdlib_module_names
+} - {"construction", "node"})
+print("Third-party imports:", ", ".join(third_party))
+unexpected = [m for m in third_party if m not in ALLOWED]
+if unexpected:
+    sys.exit("unexpected third-party modules loaded at startup: " + ", ".join(unexpected))
+"""
+
+
+def cold_start():
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"ALLOWED = {ALLOWED!r}\n" + WORKER], check=True,
+                   cwd=os.path.dirname(os.path.abspath(__file__)))
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    timings = sorted(cold_start() for _ in range(RUNS))
+    median = timings[len(timings) // 2]
+    print(f"Cold start: median {median:.3f}s, best {timings[0]:.3f}s (budget {BUDGET:.2f}s)")
+    if median > BUDGET:
+        sys.exit(f"Cold start exceeds budget of {BUDGET:.2f}s")
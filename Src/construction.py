@@ -2,12 +2,9 @@ import json
 import os
 
 import networkx as nx
-from matplotlib import pyplot as plt
 from pysat.formula import CNF
 import random
 
-from pyvis.network import Network
-
 from node import Node
 import re
 
@@ -58,6 +55,9 @@ class SATGraph:
     Network Construction Methods
     '''
 
+    def reset_graph(self):
+        self.G = nx.Graph()
+
     def toggle_directed_graph(self):
         if self.G.is_directed():
             self.G = nx.Graph()
@@ -283,6 +283,9 @@ class SATGraph:
     ''' Plotting Methods '''
 
     def plot_graph(self):
+        # matplotlib is only needed for plotting, so headless workers never load it.
+        from matplotlib import pyplot as plt
+
         pos = nx.kamada_kawai_layout(self.G)
         fig = plt.figure(figsize=(12, 12))  # Create a new figure
         ax = fig.add_subplot(1, 1, 1)  # Add a subplot to the figure
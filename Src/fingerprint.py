@@ -0,0 +1,200 @@
+import hashlib
+import warnings
+from contextlib import contextmanager
+from itertools import permutations, product
+from math import factorial
+
+import networkx as nx
+
+# WL hashes come from networkx, whose hashing can change between releases (directed hashes
+# changed in v3.5), so fingerprints are only comparable within one networkx version.
+WL_ITERATIONS = 3
+EXACT_LIMIT = 5040  # Largest number of node orderings tried for an exact canonical form
+
+
+def node_label(node):
+    """
+    Label used to seed the Weisfeiler-Lehman refinement: node kind, literal and clause.
+    :param node: Node of a SATGraph.
+    :return: String label, independent of the node's name and iteration.
+    """
+    kind = node.getName().split(".")[-1]
+    clause = node.getClause()
+    clause = "-" if clause is None else ",".join(map(str, sorted(clause)))
+    return f"{kind}|{node.getLiteral()}|{clause}"
+
+
+@contextmanager
+def _quiet_directed_warning():
+    """
+    Silences the networkx >= 3.5 warning that directed WL hashes changed, raised on every call.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="The hashes produced for directed graphs changed")
+        yield
+
+
+def labelled_graph(sat_graph):
+    """
+    Copies the construction onto integer nodes carrying a "label" attribute.
+    :param sat_graph: SATGraph whose graph should be copied.
+    :return: networkx graph of the same type as the construction.
+    """
+    g = sat_graph.getGraph()
+    h = g.__class__()
+    index = {}
+    for i, node in enumerate(g.nodes):
+        index[node] = i
+        h.add_node(i, label=node_label(node))
+    h.add_edges_from((index[u], index[v]) for u, v in g.edges)
+    return h
+
+
+def wl_fingerprint(sat_graph, iterations=WL_ITERATIONS):
+    """
+    Weisfeiler-Lehman hash of a construction, seeded with literal/clause/kind labels.
+    Isomorphic constructions always share a fingerprint; distinct ones collide only rarely.
+    Fingerprints are only comparable when computed with the same networkx version.
+    :param sat_graph: SATGraph to fingerprint.
+    :param iterations: Number of WL refinement rounds.
+    :return: Hex digest string.
+    """
+    return _wl_hash(labelled_graph(sat_graph), iterations)
+
+
+def _wl_hash(h, iterations=WL_ITERATIONS):
+    """
+    WL hash of a labelled graph, prefixed with its directedness and size.
+    """
+    with _quiet_directed_warning():
+        wl = nx.weisfeiler_lehman_graph_hash(h, node_attr="label", iterations=iterations)
+    prefix = "d" if h.is_directed() else "u"
+    return f"{prefix}{h.number_of_nodes()}.{h.number_of_edges()}.{wl}"
+
+
+def canonical_form(sat_graph, limit=EXACT_LIMIT):
+    """
+    Exact canonical form of a small construction. Nodes are ordered by their WL color and
+    every ordering within a color class is tried; the lexicographically smallest edge list wins.
+    :param sat_graph: SATGraph to canonicalize.
+    :param limit: Maximum number of orderings to try.
+    :return: Tuple (directed, node labels, edges), equal for exactly the isomorphic constructions.
+    """
+    return _canonical_form(labelled_graph(sat_graph), limit)
+
+
+def _canonical_form(h, limit=EXACT_LIMIT):
+    """
+    Canonical form of a labelled graph, see canonical_form.
+    """
+    directed = h.is_directed()
+    with _quiet_directed_warning():
+        colors = nx.weisfeiler_lehman_subgraph_hashes(h, node_attr="label", iterations=WL_ITERATIONS)
+    classes = {}
+    for node in h.nodes:
+        key = (h.nodes[node]["label"], colors[node][-1] if colors[node] else "")
+        classes.setdefault(key, []).append(node)
+    keys = sorted(classes)
+
+    orderings = 1
+    for key in keys:
+        orderings *= factorial(len(classes[key]))
+    if orderings > limit:
+        raise ValueError(f"Graph too large for an exact canonical form ({orderings} orderings > {limit}).")
+
+    labels = tuple(key[0] for key in keys for _ in classes[key])
+    best = None
+    for choice in product(*(permutations(classes[key]) for key in keys)):
+        position = {node: i for i, node in enumerate(n for group in choice for n in group)}
+        edges = []
+        for u, v in h.edges:
+            i, j = position[u], position[v]
+            edges.append((i, j) if directed or i < j else (j, i))
+        edges = tuple(sorted(edges))
+        if best is None or edges < best:
+            best = edges
+    return directed, labels, best
+
+
+def canonical_fingerprint(sat_graph, limit=EXACT_LIMIT):
+    """
+    Hash of the exact canonical form.
+    :param sat_graph: SATGraph to fingerprint.
+    :param limit: Maximum number of orderings to try, see canonical_form.
+    :return: Hex digest string.
+    """
+    return hashlib.blake2b(repr(canonical_form(sat_graph, limit)).encode(), digest_size=16).hexdigest()
+
+
+class FingerprintIndex:
+    """
+    Dedupe index of constructions keyed on their WL fingerprint. Adding a construction with a
+    new fingerprint costs only the WL hash. On a fingerprint match, the exact canonical forms
+    of both graphs are computed (and cached) to confirm the duplicate.
+
+    Graphs over exact_limit cannot be confirmed, so by default a match involving one is not
+    reported as a duplicate. With strict=False such a match counts anyway, i.e. large graphs are
+    deduplicated on the probabilistic WL hash and a collision could drop a non-isomorphic
+    construction.
+    """
+
+    def __init__(self, exact_limit=EXACT_LIMIT, strict=True):
+        self.exact_limit = exact_limit
+        self.strict = strict
+        self.entries = {}
+
+    def _canonical(self, entry):
+        """
+        Exact canonical form of an entry [key, graph, form], computed on first use.
+        :return: The canonical form, or None if the graph is over exact_limit.
+        """
+        if entry[1] is not None:
+            try:
+                entry[2] = _canonical_form(entry[1], self.exact_limit)
+            except ValueError:
+                entry[2] = None
+            entry[1] = None  # The labelled copy is no longer needed
+        return entry[2]
+
+    def _find(self, sat_graph):
+        """
+        :return: Tuple (fingerprint, entry for sat_graph, key of an equivalent entry or None).
+        """
+        h = labelled_graph(sat_graph)
+        fingerprint = _wl_hash(h)
+        entry = [None, h, None]
+        for other in self.entries.get(fingerprint, []):
+            canonical = self._canonical(entry)
+            other_canonical = None if canonical is None else self._canonical(other)
+            if canonical is None or other_canonical is None:
+                if not self.strict:
+                    return fingerprint, entry, other[0]
+            elif canonical == other_canonical:
+                return fingerprint, entry, other[0]
+        return fingerprint, entry, None
+
+    def lookup(self, sat_graph):
+        """
+        :param sat_graph: SATGraph to look up.
+        :return: Key of an equivalent construction already in the index, or None.
+        """
+        return self._find(sat_graph)[2]
+
+    def add(self, sat_graph, key):
+        """
+        Records a construction unless an equivalent one is already indexed.
+        :param sat_graph: SATGraph to record.
+        :param key: Identifier stored for the construction, e.g. its operation sequence.
+        :return: Key of the equivalent construction if it is a duplicate, otherwise None.
+        """
+        fingerprint, entry, existing = self._find(sat_graph)
+        if existing is None:
+            entry[0] = key
+            self.entries.setdefault(fingerprint, []).append(entry)
+        return existing
+
+    def __contains__(self, sat_graph):
+        return self.lookup(sat_graph) is not None
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.entries.values())
@@ -2,25 +2,25 @@ import os
 import sys
 import threading
 import socketserver
-import networkx as nx
 from PyQt5.QtGui import QFont
-from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QTabWidget,
     QWidget, QLabel, QSpinBox, QPushButton, QTextEdit, QListWidget, QMenu, QMessageBox, QComboBox
 )
 from PyQt5.QtCore import QTimer, Qt, QUrl
 import qdarktheme
-from pysat.formula import CNF
 from construction import SATGraph
 from http.server import SimpleHTTPRequestHandler
 
+# QtWebEngineWidgets is imported lazily by GraphViewer, after the QApplication exists.
+QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+
 G = SATGraph()
 
 class SATGen(QWidget):
     def __init__(self):
         super().__init__()
-        self.cnf = CNF()
+        self.cnf = G.getCNF()
 
         main_layout = QVBoxLayout(self)
 
@@ -119,7 +119,7 @@ class Constructor(QWidget):
             self.rebuild_graph()
 
     def rebuild_graph(self):
-        G.G = nx.Graph()
+        G.reset_graph()
         for op in self.operations:
             try:
                 self.opcodes[op]()
@@ -148,19 +148,27 @@ class GraphViewer(QWidget):
         super().__init__()
         self.httpd = None
         self.server_port = None
+        self.webview = None
         self.start_local_server()
 
+        self.view_layout = QVBoxLayout()
+        self.setLayout(self.view_layout)
+
+    def build_webview(self):
+        # QtWebEngine is heavy; load it only once the viewer tab is first opened.
+        from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings
+
         self.webview = QWebEngineView()
         self.webview.settings().setAttribute(QWebEngineSettings.JavascriptEnabled, True)
         self.webview.settings().setAttribute(QWebEngineSettings.LocalContentCanAccessFileUrls, True)
         self.webview.settings().setAttribute(QWebEngineSettings.LocalContentCanAccessRemoteUrls, True)
         self.webview.settings().setAttribute(QWebEngineSettings.AllowRunningInsecureContent, True)
         self.webview.setStyleSheet("background-color: #202124;")
-
-        layout = QVBoxLayout()
-        layout.addWidget(self.webview)
-        self.setLayout(layout)
-        QTimer.singleShot(1000, self.load_webview)
+        self.view_layout.addWidget(self.webview)
+        if self.server_port:
+            self.load_webview()
+        else:
+            QTimer.singleShot(1000, self.load_webview)
 
     def start_local_server(self):
         data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Data'))
@@ -185,7 +193,10 @@ class GraphViewer(QWidget):
             QMessageBox.critical(self, "Error", "Failed to load Graph Viewer. Server not started.")
 
     def reload_webview(self):
-        self.webview.reload()
+        if self.webview is None:
+            self.build_webview()
+        else:
+            self.webview.reload()
 
 
 class MainWindow(QMainWindow):
@@ -0,0 +1,122 @@
+import random
+import warnings
+from itertools import combinations
+
+import networkx as nx
+import pytest
+from pysat.formula import CNF
+
+from construction import SATGraph
+from fingerprint import (
+    FingerprintIndex,
+    canonical_fingerprint,
+    canonical_form,
+    labelled_graph,
+    wl_fingerprint,
+)
+
+CNF_CLAUSES = [[1, -2, 3], [-1, 2, 3]]
+
+NODE_OPS = ["clause_to_clique", "clause_to_cluster", "literal_to_node",
+            "literal_and_negation_to_node", "variable_to_node"]
+EDGE_OPS = ["all_to_all", "x_to_x", "x_to_not_x", "x_to_all_but_x", "x_to_all_but_not_x"]
+
+
+def build(ops, clauses=CNF_CLAUSES, directed=False):
+    g = SATGraph(CNF(from_clauses=clauses))
+    if directed:
+        g.toggle_directed_graph()
+    for op in ops:
+        getattr(g, op)()
+    return g
+
+
+def test_x_to_x_and_all_but_x_equals_all_to_all():
+    a = build(["clause_to_cluster", "x_to_x", "x_to_all_but_x"])
+    b = build(["clause_to_cluster", "all_to_all"])
+    assert wl_fingerprint(a) == wl_fingerprint(b)
+    assert canonical_form(a) == canonical_form(b)
+    assert canonical_fingerprint(a) == canonical_fingerprint(b)
+
+
+def test_reordered_operations_collide():
+    a = build(["clause_to_cluster", "literal_to_node", "x_to_x", "x_to_not_x"])
+    b = build(["literal_to_node", "clause_to_cluster", "x_to_not_x", "x_to_x"])
+    assert wl_fingerprint(a) == wl_fingerprint(b)
+    assert canonical_form(a) == canonical_form(b)
+
+
+def test_clique_and_cluster_differ():
+    a = build(["clause_to_clique"])
+    b = build(["clause_to_cluster"])
+    assert wl_fingerprint(a) != wl_fingerprint(b)
+    assert canonical_form(a) != canonical_form(b)
+
+
+def test_directed_reordered_operations_collide():
+    a = build(["clause_to_cluster", "literal_to_node", "dir_x_to_x", "dir_x_to_not_x"], directed=True)
+    b = build(["literal_to_node", "clause_to_cluster", "dir_x_to_not_x", "dir_x_to_x"], directed=True)
+    c = build(["clause_to_cluster", "literal_to_node", "x_to_x", "x_to_not_x"])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert wl_fingerprint(a) == wl_fingerprint(b)
+        assert canonical_form(a) == canonical_form(b)
+    assert wl_fingerprint(a) != wl_fingerprint(c)
+    assert canonical_form(a) != canonical_form(c)
+
+
+def random_construction(rng):
+    clauses = [[rng.choice([-1, 1]) * v for v in rng.sample(range(1, 4), k=3)]
+               for _ in range(rng.randint(1, 2))]
+    ops = rng.sample(NODE_OPS, k=rng.randint(1, 2)) + rng.sample(EDGE_OPS, k=rng.randint(0, 2))
+    return build(ops, clauses)
+
+
+def test_canonical_form_matches_isomorphism():
+    rng = random.Random(0)
+    graphs = [random_construction(rng) for _ in range(30)]
+    for a, b in combinations(graphs, 2):
+        try:
+            same = canonical_form(a) == canonical_form(b)
+        except ValueError:
+            continue
+        expected = nx.is_isomorphic(labelled_graph(a), labelled_graph(b),
+                                    node_match=lambda x, y: x["label"] == y["label"])
+        assert same == expected
+        if expected:
+            assert wl_fingerprint(a) == wl_fingerprint(b)
+
+
+def test_canonical_form_over_limit():
+    g = build(["clause_to_clique", "clause_to_clique"])
+    with pytest.raises(ValueError):
+        canonical_form(g, limit=1)
+
+
+def test_index_add_and_len():
+    index = FingerprintIndex()
+    assert index.add(build(["clause_to_cluster", "all_to_all"]), "all") is None
+    assert index.add(build(["clause_to_cluster", "x_to_x", "x_to_all_but_x"]), "split") == "all"
+    assert index.add(build(["clause_to_clique"]), "clique") is None
+    assert len(index) == 2
+    assert build(["clause_to_clique"]) in index
+    assert build(["clause_to_cluster"]) not in index
+
+
+def test_index_strict_over_limit():
+    a = build(["clause_to_clique", "clause_to_clique", "x_to_x"])
+    b = build(["clause_to_clique", "x_to_x", "clause_to_clique", "x_to_x"])
+
+    strict = FingerprintIndex(exact_limit=1)
+    strict.add(a, "a")
+    assert strict.lookup(b) is None
+    assert strict.add(b, "b") is None
+    assert len(strict) == 2
+
+    loose = FingerprintIndex(exact_limit=1, strict=False)
+    loose.add(a, "a")
+    assert loose.lookup(b) == "a"
+
+    confirmed = FingerprintIndex()
+    confirmed.add(a, "a")
+    assert confirmed.lookup(b) == "a"